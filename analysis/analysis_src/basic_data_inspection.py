@@ -1,34 +1,92 @@
+import html
+import io
+import sys
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Callable, Optional
 import pandas as pd
 
 # ===== Abstract Strategy =====
 class DataInspectionStrategy(ABC):
     @abstractmethod
-    def inspect(self, df: pd.DataFrame) -> None:
-        """Run a specific inspection and print/return visuals."""
+    def render(self, df: pd.DataFrame) -> str:
+        """Run a specific inspection and return the report as text."""
         raise NotImplementedError
 
+    def inspect(self, df: pd.DataFrame) -> None:
+        print(self.render(df))
+
 # ===== Concrete Strategies =====
 class DataTypesInspectionStrategy(DataInspectionStrategy):
-    def inspect(self, df: pd.DataFrame) -> None:
+    def __init__(self, verbose: bool = False):
+        # verbose=True falls back to the full df.info() report
+        self.verbose = verbose
+
+    def render(self, df: pd.DataFrame) -> str:
         # Shows column dtypes + non-null counts; great first glance
-        print("\n[Data Types & Non-Null Counts]")
-        print(df.info())
+        out = ["\n[Data Types & Non-Null Counts]"]
+        if self.verbose:
+            buf = io.StringIO()
+            df.info(buf=buf)
+            out.append(buf.getvalue())
+            return "\n".join(out)
+        non_null = df.count()  # one vectorized pass instead of df.info()'s per-column loop
+        summary = pd.DataFrame({
+            "dtype": df.dtypes.astype(str),
+            "non_null": non_null,
+            "nulls": len(df) - non_null,
+        })
+        out.append(f"{len(df)} rows x {df.shape[1]} columns")
+        out.append(str(summary))
+        return "\n".join(out)
 
 class SummaryStatisticsInspectionStrategy(DataInspectionStrategy):
-    def inspect(self, df: pd.DataFrame) -> None:
+    def render(self, df: pd.DataFrame) -> str:
         # Numeric stats
-        print("\n[Summary Stats — Numeric]")
-        print(df.describe())
-
-        # Categorical stats (check before describing)
-        cat_cols = df.select_dtypes(include=["object"]).columns
-        if len(cat_cols) > 0:
-            print("\n[Summary Stats — Categorical]")
-            print(df.describe(include=["O"]))
+        # Only the median is requested: every extra percentile is another sort per column
+        out = ["\n[Summary Stats — Numeric]", str(df.describe(percentiles=[0.5]))]
+
+        # Categorical stats (check before describing); reuse the selection instead of
+        # letting describe(include=...) run select_dtypes a second time
+        cat_cols = df.select_dtypes(include=["object"]).columns.tolist()
+        out.append("\n[Summary Stats — Categorical]")
+        if cat_cols:
+            out.append(str(df[cat_cols].describe()))
         else:
-            print("\n[Summary Stats — Categorical]")
-            print("No categorical columns found.")
+            out.append("No categorical columns found.")
+        return "\n".join(out)
+
+
+# ===== Deferred Result =====
+@dataclass
+class LazyInspection:
+    """Holds an inspection that only runs when displayed (print/repr or notebook output)."""
+    thunk: Callable[[], str]
+    _report: Optional[str] = field(default=None, init=False, repr=False)
+
+    def report(self) -> str:
+        if self._report is None:  # computed once, then reused
+            self._report = self.thunk()
+        return self._report
+
+    def __repr__(self) -> str:
+        return self.report()
+
+    def _repr_html_(self) -> str:
+        return f"<pre>{html.escape(self.report())}</pre>"
+
+
+def _in_pipeline_step() -> bool:
+    # Inside a ZenML step nobody reads the printout, so inspections are deferred there.
+    # A step can only be running if zenml is already imported, so notebooks never pay for it.
+    if "zenml" not in sys.modules:
+        return False
+    try:
+        from zenml import get_step_context
+        get_step_context()
+    except Exception:
+        return False
+    return True
 
 
 # ===== Context =====
@@ -39,5 +97,15 @@ class DataInspector:
     def set_strategy(self, strategy: DataInspectionStrategy) -> None:
         self._strategy = strategy
 
-    def execute_inspection(self, df: pd.DataFrame) -> None:
+    def execute_inspection(self, df: pd.DataFrame, lazy: Optional[bool] = None) -> Optional[LazyInspection]:
+        """
+        Prints the inspection right away (notebook default). With lazy=True, or when running
+        inside a ZenML step, nothing is computed; a LazyInspection is returned instead.
+        """
+        if lazy is None:
+            lazy = _in_pipeline_step()
+        if lazy:
+            strategy = self._strategy
+            return LazyInspection(lambda: strategy.render(df))
         self._strategy.inspect(df)
+        return None
@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
+from analysis.analysis_src.figures import show_or_save
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+# Above this many points a scatter is drawn as a hexbin density (one artist instead of N markers)
+HEXBIN_MIN_POINTS = 5000
+
 class BivariateAnalysisStrategy(ABC):
     @abstractmethod
     def analyze(self, df: pd.DataFrame, feature1: str, feature2: str) -> None: ...
@@ -10,20 +15,28 @@ class BivariateAnalysisStrategy(ABC):
 class NumericalVsNumericalAnalysis(BivariateAnalysisStrategy):
     def analyze(self, df: pd.DataFrame, feature1: str, feature2: str) -> None:
         # Useful for sensor vs. cycle or sensor vs. sensor
-        plt.figure(figsize=(8, 6))
-        sns.scatterplot(x=df[feature1], y=df[feature2], s=10, alpha=0.5)
-        plt.title(f"{feature1} vs {feature2}")
-        plt.xlabel(feature1); plt.ylabel(feature2)
-        plt.show()
+        x = df[feature1].to_numpy(dtype=np.float64)
+        y = df[feature2].to_numpy(dtype=np.float64)
+        keep = ~(np.isnan(x) | np.isnan(y))
+        x, y = x[keep], y[keep]
+        fig, ax = plt.subplots(figsize=(8, 6))
+        if x.size > HEXBIN_MIN_POINTS:
+            hb = ax.hexbin(x, y, gridsize=60, mincnt=1, cmap="viridis")
+            fig.colorbar(hb, ax=ax, label="count")
+        else:
+            ax.scatter(x, y, s=10, alpha=0.5)
+        ax.set_title(f"{feature1} vs {feature2}")
+        ax.set_xlabel(feature1); ax.set_ylabel(feature2)
+        show_or_save(fig, f"{feature1}_vs_{feature2}")
 
 class CategoricalVsNumericalAnalysis(BivariateAnalysisStrategy):
     def analyze(self, df: pd.DataFrame, feature1: str, feature2: str) -> None:
         # e.g., if you bin cycles into categories and compare sensor distribution
-        plt.figure(figsize=(10, 6))
-        sns.boxplot(x=feature1, y=feature2, data=df)
-        plt.title(f"{feature1} vs {feature2}")
-        plt.xticks(rotation=30)
-        plt.show()
+        fig, ax = plt.subplots(figsize=(10, 6))
+        sns.boxplot(x=feature1, y=feature2, data=df, ax=ax)
+        ax.set_title(f"{feature1} vs {feature2}")
+        ax.tick_params(axis="x", labelrotation=30)
+        show_or_save(fig, f"{feature1}_vs_{feature2}")
 
 class BivariateAnalyzer:
     def __init__(self, strategy: BivariateAnalysisStrategy):
@@ -0,0 +1,26 @@
+import os
+from pathlib import Path
+
+import matplotlib
+
+# When ANALYSIS_SAVE_DIR is set (pipelines/CI), render off-screen with Agg and write PNGs
+# instead of opening GUI windows. An explicit MPLBACKEND (e.g. Jupyter's inline backend) wins.
+SAVE_DIR = os.environ.get("ANALYSIS_SAVE_DIR")
+if SAVE_DIR and not os.environ.get("MPLBACKEND"):
+    matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402  (backend must be chosen first)
+
+
+def show_or_save(fig: plt.Figure, name: str) -> None:
+    """Show the figure (or save it as <SAVE_DIR>/<name>.png), then free it."""
+    try:
+        if SAVE_DIR:
+            out_dir = Path(SAVE_DIR)
+            out_dir.mkdir(parents=True, exist_ok=True)
+            fig.savefig(out_dir / f"{name}.png", dpi=100)
+        else:
+            plt.show()
+    finally:
+        # figures stay registered with pyplot until closed; long runs would leak them
+        plt.close(fig)
@@ -1,28 +1,42 @@
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
+from analysis.analysis_src.figures import show_or_save
 import matplotlib.pyplot as plt
 import seaborn as sns
+
+# Heatmaps draw one cell per row; beyond this many rows we fold rows into blocks
+HEATMAP_MAX_ROWS = 2000
+
 #using template pattern
 class MissingValuesAnalysisTemplate(ABC):
     def analyze(self, df: pd.DataFrame) -> None:
         # High-level template: identify -> visualize
-        self.identify_missing_values(df)
-        self.visualize_missing_values(df)
+        # build the null mask once and share it between both steps
+        mask = df.isna()
+        self.identify_missing_values(df, mask)
+        self.visualize_missing_values(df, mask)
 
     @abstractmethod
-    def identify_missing_values(self, df: pd.DataFrame) -> None: ...
+    def identify_missing_values(self, df: pd.DataFrame, mask: pd.DataFrame) -> None: ...
     @abstractmethod
-    def visualize_missing_values(self, df: pd.DataFrame) -> None: ...
+    def visualize_missing_values(self, df: pd.DataFrame, mask: pd.DataFrame) -> None: ...
 
 class SimpleMissingValuesAnalysis(MissingValuesAnalysisTemplate):
-    def identify_missing_values(self, df: pd.DataFrame) -> None:
+    def identify_missing_values(self, df: pd.DataFrame, mask: pd.DataFrame) -> None:
         print("\n[Missing Values by Column]")
-        missing = df.isnull().sum()
+        missing = mask.sum(axis=0)
         print(missing[missing > 0])
 
-    def visualize_missing_values(self, df: pd.DataFrame) -> None:
+    def visualize_missing_values(self, df: pd.DataFrame, mask: pd.DataFrame) -> None:
         print("\n[Heatmap of Missing Values]")
-        plt.figure(figsize=(12, 6))
-        sns.heatmap(df.isnull(), cbar=False)
-        plt.title("Missing Values Heatmap")
-        plt.show()
+        step = max(1, -(-len(mask) // HEATMAP_MAX_ROWS))  # ceil: never more than HEATMAP_MAX_ROWS rows
+        if step > 1:
+            # OR-reduce each block of `step` rows so a single missing cell still shows up
+            starts = np.arange(0, len(mask), step)
+            blocks = np.logical_or.reduceat(mask.to_numpy(), starts, axis=0)
+            mask = pd.DataFrame(blocks, index=mask.index[starts], columns=mask.columns)
+        fig, ax = plt.subplots(figsize=(12, 6))
+        sns.heatmap(mask, cbar=False, ax=ax)
+        ax.set_title("Missing Values Heatmap")
+        show_or_save(fig, "missing_values_heatmap")
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
+from analysis.analysis_src.figures import show_or_save
 import matplotlib.pyplot as plt
 import seaborn as sns
 
@@ -11,19 +13,35 @@ class MultivariateAnalysisTemplate(ABC):
     @abstractmethod
     def generate_correlation_heatmap(self, df: pd.DataFrame) -> None: ...
     @abstractmethod
-    def generate_pairplot(self, df: pd.DataFrame) -> None: ...
+    def generate_pairplot(self, df: pd.DataFrame, max_cols: int = 8, max_rows: int = 5000) -> None: ...
 
 class SimpleMultivariateAnalysis(MultivariateAnalysisTemplate):
     def generate_correlation_heatmap(self, df: pd.DataFrame) -> None:
         # Correlations among sensors; choose numeric subset to avoid clutter
-        plt.figure(figsize=(12, 10))
-        corr = df.corr(numeric_only=True)
-        sns.heatmap(corr, cmap="coolwarm", center=0)
-        plt.title("Correlation Heatmap (numeric features)")
-        plt.show()
+        fig, ax = plt.subplots(figsize=(12, 10))
+        num = df.select_dtypes("number").dropna(axis=1, how="all")
+        vals = num.to_numpy(dtype=np.float64)
+        if np.isnan(vals).any():
+            # pairwise-complete correlations need pandas' NaN-aware path
+            corr = num.corr()
+        else:
+            # one vectorized pass over the whole matrix instead of per-pair loops; constant
+            # sensors have zero variance, so their rows come out NaN (as with pandas) - no warning
+            with np.errstate(invalid="ignore", divide="ignore"):
+                corr = pd.DataFrame(np.corrcoef(vals, rowvar=False), index=num.columns, columns=num.columns)
+        sns.heatmap(corr, cmap="coolwarm", center=0, ax=ax)
+        ax.set_title("Correlation Heatmap (numeric features)")
+        show_or_save(fig, "correlation_heatmap")
 
-    def generate_pairplot(self, df: pd.DataFrame) -> None:
-        # For visibility, pass a small set of columns from the notebook
-        sns.pairplot(df, corner=True, plot_kws=dict(s=10, alpha=0.4))
-        plt.suptitle("Pair Plot (selected features)", y=1.02)
-        plt.show()
+    def generate_pairplot(self, df: pd.DataFrame, max_cols: int = 8, max_rows: int = 5000) -> None:
+        # Render cost grows with cols² x rows: keep the highest-variance numeric columns
+        # and a row sample so wide/long frames stay interactive
+        nums = df.select_dtypes("number")
+        top = nums.var().nlargest(max_cols).index
+        sub = nums[top]
+        if len(sub) > max_rows:
+            sub = sub.sample(max_rows, random_state=0)
+        print(f"\n[Pair Plot] columns: {list(top)} | rows: {len(sub)} of {len(df)}")
+        grid = sns.pairplot(sub, corner=True, plot_kws=dict(s=8, alpha=0.3))
+        grid.figure.suptitle("Pair Plot (selected features)", y=1.02)
+        show_or_save(grid.figure, "pairplot")
@@ -1,5 +1,9 @@
+import numpy as np
 import pandas as pd
+from analysis.analysis_src.figures import show_or_save
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import seaborn as sns
 
 def plot_sensor_over_cycles(df: pd.DataFrame, sensor: str, n_engines: int = 4) -> None:
@@ -8,36 +12,47 @@ def plot_sensor_over_cycles(df: pd.DataFrame, sensor: str, n_engines: int = 4) -
     df must have columns: ['engine_id', 'cycle', sensor]
     """
     # pick a few engines to avoid overplotting
-    engines = df["engine_id"].drop_duplicates().sample(min(n_engines, df["engine_id"].nunique()), random_state=42)
-    plt.figure(figsize=(10, 6))
-    for eid in engines:
-        sub = df[df["engine_id"] == eid]
-        plt.plot(sub["cycle"], sub[sensor], marker="", linewidth=1, alpha=0.9, label=f"engine {eid}")
-    plt.title(f"{sensor} over cycles (sample of {len(engines)} engines)")
-    plt.xlabel("cycle"); plt.ylabel(sensor)
-    plt.legend()
-    plt.show()
+    ids = pd.unique(df["engine_id"].to_numpy())  # single hash pass, reused for the sample size
+    engines = np.random.default_rng(42).choice(ids, size=min(n_engines, ids.size), replace=False)
+    # one pass to keep only the sampled engines, then split them in a single groupby
+    sub = df.loc[df["engine_id"].isin(engines), ["engine_id", "cycle", sensor]]
+    groups = list(sub.groupby("engine_id", sort=False, observed=True))
+    segments = [np.column_stack((g["cycle"].to_numpy(), g[sensor].to_numpy())) for _, g in groups]
+    colors = plt.cm.viridis(np.linspace(0, 1, len(segments)))
+    # all traces in one collection -> one draw call instead of one Line2D per engine
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.add_collection(LineCollection(segments, colors=colors, linewidths=1, alpha=0.9))
+    ax.autoscale()
+    ax.set_title(f"{sensor} over cycles (sample of {len(engines)} engines)")
+    ax.set_xlabel("cycle"); ax.set_ylabel(sensor)
+    # the collection has no per-engine labels, so build the legend from lightweight proxies
+    handles = [Line2D([], [], color=c, linewidth=1, label=f"engine {eid}") for (eid, _), c in zip(groups, colors)]
+    ax.legend(handles=handles)
+    show_or_save(fig, f"{sensor}_over_cycles")
 
 def plot_cycles_per_engine(df: pd.DataFrame) -> None:
     """
     Show distribution of number of cycles each engine ran in TRAIN set.
     """
-    counts = df.groupby("engine_id")["cycle"].max().reset_index(name="max_cycle")
-    plt.figure(figsize=(8, 5))
-    sns.histplot(counts["max_cycle"], bins=30, kde=True)
-    plt.title("Distribution of max cycles per engine (train)")
-    plt.xlabel("max cycle"); plt.ylabel("count of engines")
-    plt.show()
+    counts = df.groupby("engine_id", observed=True)["cycle"].max().reset_index(name="max_cycle")
+    fig, ax = plt.subplots(figsize=(8, 5))
+    sns.histplot(counts["max_cycle"], bins=30, kde=True, ax=ax)
+    ax.set_title("Distribution of max cycles per engine (train)")
+    ax.set_xlabel("max cycle"); ax.set_ylabel("count of engines")
+    show_or_save(fig, "cycles_per_engine")
 
 def plot_settings_relationship(df: pd.DataFrame, sensor: str) -> None:
     """
     Visualize how operational settings relate to a sensor (scatter in 3 small panels).
     """
+    # plain matplotlib on pre-converted arrays: skips seaborn's per-call dispatch/inference;
+    # rasterized markers keep saved figures small and fast to flush
+    y = df[sensor].to_numpy()
     fig, axes = plt.subplots(1, 3, figsize=(14, 4), sharey=True)
     for i, ax in enumerate(axes, start=1):
-        sns.scatterplot(x=df[f"setting_{i}"], y=df[sensor], s=8, alpha=0.4, ax=ax)
+        ax.scatter(df[f"setting_{i}"].to_numpy(), y, s=8, alpha=0.4, rasterized=True)
         ax.set_title(f"{sensor} vs setting_{i}")
         ax.set_xlabel(f"setting_{i}"); ax.set_ylabel(sensor if i == 1 else "")
     fig.suptitle(f"{sensor} vs operational settings")
-    plt.tight_layout()
-    plt.show()
+    fig.tight_layout()
+    show_or_save(fig, f"{sensor}_vs_settings")
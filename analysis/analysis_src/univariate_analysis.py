@@ -1,8 +1,14 @@
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
+from scipy.stats import gaussian_kde
+from analysis.analysis_src.figures import show_or_save
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+# The KDE overlay is fit on at most this many points; the histogram always uses all of them
+KDE_MAX_SAMPLES = 20_000
+
 class UnivariateAnalysisStrategy(ABC):
     @abstractmethod
     def analyze(self, df: pd.DataFrame, feature: str) -> None: ...
@@ -10,21 +16,31 @@ class UnivariateAnalysisStrategy(ABC):
 class NumericalUnivariateAnalysis(UnivariateAnalysisStrategy):
     def analyze(self, df: pd.DataFrame, feature: str) -> None:
         # Histogram + KDE for sensor or cycle column
-        plt.figure(figsize=(10, 5))
-        sns.histplot(df[feature].dropna(), bins=40, kde=True)
-        plt.title(f"Distribution of {feature}")
-        plt.xlabel(feature)
-        plt.ylabel("Count")
-        plt.show()
+        arr = df[feature].to_numpy(dtype=np.float64)
+        arr = arr[~np.isnan(arr)]
+        counts, edges = np.histogram(arr, bins=40)
+        fig, ax = plt.subplots(figsize=(10, 5))
+        ax.stairs(counts, edges, fill=True, alpha=0.6)
+        if arr.size > 1 and np.ptp(arr) > 0:  # KDE is undefined for constant sensors
+            sample = arr
+            if arr.size > KDE_MAX_SAMPLES:
+                sample = np.random.default_rng(42).choice(arr, size=KDE_MAX_SAMPLES, replace=False)
+            xs = np.linspace(edges[0], edges[-1], 200)
+            # scale the density to histogram counts so both share the y-axis
+            ax.plot(xs, gaussian_kde(sample)(xs) * arr.size * (edges[1] - edges[0]))
+        ax.set_title(f"Distribution of {feature}")
+        ax.set_xlabel(feature)
+        ax.set_ylabel("Count")
+        show_or_save(fig, f"distribution_{feature}")
 
 class CategoricalUnivariateAnalysis(UnivariateAnalysisStrategy):
     def analyze(self, df: pd.DataFrame, feature: str) -> None:
         # Kept for parity; often unused in C-MAPSS
-        plt.figure(figsize=(10, 5))
-        sns.countplot(x=feature, data=df)
-        plt.title(f"Frequency of {feature}")
-        plt.xticks(rotation=45)
-        plt.show()
+        fig, ax = plt.subplots(figsize=(10, 5))
+        sns.countplot(x=feature, data=df, ax=ax)
+        ax.set_title(f"Frequency of {feature}")
+        ax.tick_params(axis="x", labelrotation=45)
+        show_or_save(fig, f"frequency_{feature}")
 
 class UnivariateAnalyzer:
     def __init__(self, strategy: UnivariateAnalysisStrategy):
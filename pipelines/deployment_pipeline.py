@@ -26,7 +26,7 @@ def continuous_deployment_pipeline(
     workers: int = 1,                 # safer on WSL
     deploy_decision: bool = True,
 ):
-    df = data_ingestion_step(file_path=file_path, subset=subset, part="train")
+    df = data_ingestion_step(file_path=file_path, subset=subset, part="train", columns=features)
     df = rul_labeling_step(df=df)     # ensures 'RUL'
     df = handle_missing_values_step(df=df, strategy=missing_value_strategy)
     df = outlier_detection_step(df=df, column_name="RUL")
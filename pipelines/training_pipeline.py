@@ -21,7 +21,8 @@ def training_pipeline(
     features: Optional[List[str]] = None,
 ):
     # 1) Ingest a single DataFrame (train/test/rul). We use train here.
-    df = data_ingestion_step(file_path=file_path, subset=subset, part=part)
+    #    Only the selected features (+ engine_id/cycle) are parsed.
+    df = data_ingestion_step(file_path=file_path, subset=subset, part=part, columns=features)
 
     # 2) Handle missing values (kept for parity with the house project)
     df = handle_missing_values_step(df=df, strategy=missing_value_strategy)
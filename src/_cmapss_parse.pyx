@@ -0,0 +1,110 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Fixed-schema tokenizer for C-MAPSS telemetry: 26 whitespace-separated numbers per line
+(engine_id, cycle, 3 settings, 21 sensors). Build it in place with
+`cythonize -i src/_cmapss_parse.pyx`; without the compiled extension, ingest_data
+falls back to pandas.read_csv.
+"""
+import numpy as np
+
+from libc.stdlib cimport strtod
+from libc.string cimport memchr
+
+cdef enum:
+    N_FIELDS = 26
+
+# status codes from _tokenize; turned into exceptions once the GIL is held again
+cdef enum:
+    PARSE_OK = 0
+    TOO_MANY_FIELDS = 1
+    NOT_A_NUMBER = 2
+    TOO_FEW_FIELDS = 3
+
+
+cdef inline bint _is_blank(char c) noexcept nogil:
+    return c == b" " or c == b"\t" or c == b"\r"
+
+
+cdef int _tokenize(const char* p, const char* stop, float[:, ::1] out, Py_ssize_t* row,
+                   Py_ssize_t* line_no, Py_ssize_t* field) noexcept nogil:
+    # Every line in [p, stop) must end in '\n' or be followed by a NUL, so strtod never
+    # reads past the buffer. On error, line_no/field point at the offending token.
+    cdef const char* line_end
+    cdef char* num_end
+    cdef Py_ssize_t k
+    while p < stop:
+        line_no[0] += 1
+        line_end = <const char*> memchr(p, b"\n", stop - p)
+        if line_end == NULL:
+            line_end = stop
+        k = 0
+        while True:
+            while p < line_end and _is_blank(p[0]):
+                p += 1
+            if p >= line_end:
+                break
+            if k == N_FIELDS:
+                return TOO_MANY_FIELDS
+            out[k, row[0]] = <float> strtod(p, &num_end)
+            if num_end == p or (num_end < line_end and not _is_blank(num_end[0])):
+                field[0] = k + 1
+                return NOT_A_NUMBER
+            p = num_end
+            k += 1
+        if k == N_FIELDS:
+            row[0] += 1
+        elif k:
+            field[0] = k
+            return TOO_FEW_FIELDS
+        p = line_end + 1
+    return PARSE_OK
+
+
+def parse_cmapss(const unsigned char[::1] buf):
+    """
+    Parse a whole file buffer into a (26, n_rows) float32 array, one contiguous row per
+    column. Blank lines are skipped; every other line must hold exactly 26 numeric
+    fields. The scan runs without the GIL, so other threads keep running meanwhile.
+    """
+    cdef Py_ssize_t n = buf.shape[0]
+    if n == 0:
+        return np.empty((N_FIELDS, 0), dtype=np.float32)
+
+    cdef const char* start = <const char*> &buf[0]
+    cdef const char* stop = start + n
+    cdef const char* body_end = start
+    cdef const char* nl = start
+    cdef Py_ssize_t cap = 1, row = 0, line_no = 0, field = 0
+    cdef int status
+
+    # one memchr sweep sizes the output exactly (at most one row per line) and finds
+    # where the last complete line ends
+    with nogil:
+        while True:
+            nl = <const char*> memchr(nl, b"\n", stop - nl)
+            if nl == NULL:
+                break
+            cap += 1
+            nl += 1
+            body_end = nl
+
+    # a last line without a newline gets a NUL-terminated copy, so strtod has a terminator
+    cdef bytes tail = body_end[:stop - body_end]
+    cdef const char* tail_p = tail
+    cdef Py_ssize_t tail_n = len(tail)
+
+    out_arr = np.empty((N_FIELDS, cap), dtype=np.float32)
+    cdef float[:, ::1] out = out_arr
+
+    with nogil:
+        status = _tokenize(start, body_end, out, &row, &line_no, &field)
+        if status == PARSE_OK and tail_n:
+            status = _tokenize(tail_p, tail_p + tail_n, out, &row, &line_no, &field)
+
+    if status == TOO_MANY_FIELDS:
+        raise ValueError(f"line {line_no}: more than {N_FIELDS} fields")
+    if status == NOT_A_NUMBER:
+        raise ValueError(f"line {line_no}: field {field} is not a number")
+    if status == TOO_FEW_FIELDS:
+        raise ValueError(f"line {line_no}: expected {N_FIELDS} fields, got {field}")
+    return out_arr[:, :row]
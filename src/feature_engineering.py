@@ -3,7 +3,7 @@ from abc import ABC, abstractmethod
 
 import numpy as np
 import pandas as pd
-from sklearn.preprocessing import MinMaxScaler, OneHotEncoder, StandardScaler
+from sklearn.preprocessing import KBinsDiscretizer, MinMaxScaler, OneHotEncoder, StandardScaler
 
 # Setup logging configuration
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -161,6 +161,47 @@ class OneHotEncoding(FeatureEngineeringStrategy):
         return df_transformed
 
 
+# Concrete Strategy for Quantile Binning
+# --------------------------------------
+# This strategy replaces features with ordinal quantile-bin codes stored as uint8, so
+# HistGradientBoosting (max_bins=63) trains on compact, already-binned columns.
+class QuantileBinning(FeatureEngineeringStrategy):
+    def __init__(self, features, n_bins=63):
+        """
+        Initializes the QuantileBinning with the specific features to bin.
+
+        Parameters:
+        features (list): The list of features to apply the quantile binning to.
+        n_bins (int): The number of quantile bins per feature, at most 256 to fit in uint8.
+        """
+        if not 2 <= n_bins <= 256:
+            raise ValueError("n_bins must be between 2 and 256 for uint8 bin codes.")
+        self.features = features
+        self.binner = KBinsDiscretizer(
+            n_bins=n_bins, encode="ordinal", strategy="quantile", subsample=200_000, random_state=0
+        )
+
+    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Applies quantile binning to the specified features in the DataFrame.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features to transform.
+
+        Returns:
+        pd.DataFrame: The dataframe with features replaced by uint8 bin codes.
+        """
+        logging.info(
+            f"Applying quantile binning to features: {self.features} with {self.binner.n_bins} bins"
+        )
+        df_transformed = df.copy()
+        codes = self.binner.fit_transform(df[self.features]).astype(np.uint8)
+        for i, feature in enumerate(self.features):
+            df_transformed[feature] = codes[:, i]
+        logging.info("Quantile binning completed.")
+        return df_transformed
+
+
 # Context Class for Feature Engineering
 # -------------------------------------
 # This class uses a FeatureEngineeringStrategy to apply transformations to a dataset.
@@ -219,4 +260,8 @@ if __name__ == "__main__":
     # onehot_encoder = FeatureEngineer(OneHotEncoding(features=['Neighborhood']))
     # df_onehot_encoded = onehot_encoder.apply_feature_engineering(df)
 
+    # Quantile Binning Example
+    # quantile_binner = FeatureEngineer(QuantileBinning(features=['SalePrice', 'Gr Liv Area'], n_bins=63))
+    # df_binned = quantile_binner.apply_feature_engineering(df)
+
     pass
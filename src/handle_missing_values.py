@@ -90,7 +90,7 @@ class FillMissingValuesStrategy(MissingValueHandlingStrategy):
             )
         elif self.method == "mode":
             for column in df_cleaned.columns:
-                df_cleaned[column].fillna(df[column].mode().iloc[0], inplace=True)
+                df_cleaned[column] = df_cleaned[column].fillna(df[column].mode().iloc[0])
         elif self.method == "constant":
             df_cleaned = df_cleaned.fillna(self.fill_value)
         else:
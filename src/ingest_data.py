@@ -2,22 +2,162 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
+import hashlib
+import os
 import sys
+import warnings
 import zipfile
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import List, Sequence
 
+import numpy as np
 import pandas as pd
+from pyarrow import feather
+
+try:
+    from src._cmapss_parse import parse_cmapss
+except ImportError:  # the Cython tokenizer is optional; pandas' C reader is used instead
+    parse_cmapss = None
 
 
 # --------------------------- Helper: Column Names ---------------------------
+# The layout is fixed, so it is built once; helpers below use the tuple directly
+_CMAPSS_COLUMNS: tuple[str, ...] = (
+    "engine_id", "cycle",
+    *(f"setting_{i}" for i in range(1, 4)),
+    *(f"s{i}" for i in range(1, 22)),
+)
+
+
 def cmapss_columns() -> list[str]:
-    cols = ["engine_id", "cycle"]
-    cols += [f"setting_{i}" for i in range(1, 4)]
-    cols += [f"s{i}" for i in range(1, 22)]
-    return cols
+    return list(_CMAPSS_COLUMNS)  # fresh list, callers may mutate it
+
+
+def cmapss_dtypes() -> dict[str, str]:
+    # engine_id < 300 and cycle < 600 in every subset, and sensor readings fit float32; reading
+    # straight into compact types keeps every downstream frame a fraction of the default size
+    dtypes = {"engine_id": "int16", "cycle": "int16"}
+    dtypes.update({c: "float32" for c in _CMAPSS_COLUMNS[2:]})
+    return dtypes
+
+
+# ------------------------------ Helper: Parsing -----------------------------
+def _resolve_usecols(columns: list[str] | None) -> list[str] | None:
+    # engine_id/cycle are always kept: RUL labeling and every per-engine step need them
+    if columns is None:
+        return None
+    unknown = sorted(set(columns).difference(_CMAPSS_COLUMNS))
+    if unknown:
+        raise ValueError(f"Unknown C-MAPSS columns requested: {unknown}")
+    keys = ["engine_id", "cycle"]
+    return keys + [c for c in _CMAPSS_COLUMNS if c in columns and c not in keys]
+
+
+def _read_whitespace_table(src, names: Sequence[str], dtypes: dict[str, str],
+                           usecols: list[str] | None = None) -> pd.DataFrame:
+    r"""
+    Parse a C-MAPSS style whitespace table. pandas special-cases sep=r"\s+" to its C
+    whitespace tokenizer (no Python regex), which also absorbs the trailing spaces.
+    `src` is a path or an open binary file (e.g. a zip member).
+    """
+    return pd.read_csv(src, sep=r"\s+", header=None, names=list(names), dtype=dtypes, usecols=usecols)
+
+
+def _parse_telemetry_fixed(src, usecols: list[str] | None = None) -> pd.DataFrame:
+    # The compiled tokenizer knows the 26-column layout, so it skips pandas' generic
+    # tokenizer/converter and writes straight into one float32 array per column
+    values = parse_cmapss(src.read() if hasattr(src, "read") else Path(src).read_bytes())
+    names, dtypes = _CMAPSS_COLUMNS, cmapss_dtypes()
+    keep = names if usecols is None else usecols
+    return pd.DataFrame({c: values[names.index(c)].astype(dtypes[c], copy=False) for c in keep})
+
+
+def _read_telemetry(src, usecols: list[str] | None = None) -> pd.DataFrame:
+    if parse_cmapss is not None:
+        df = _parse_telemetry_fixed(src, usecols)
+    else:
+        # usecols lets the parser skip converting unused sensor fields entirely
+        df = _read_whitespace_table(src, _CMAPSS_COLUMNS, cmapss_dtypes(), usecols)
+    # Guarantee (engine_id, cycle) order so every engine is one contiguous, cycle-ordered run.
+    # The official files already are, so the common case is a single vectorized check.
+    eid, cyc = df["engine_id"].to_numpy(), df["cycle"].to_numpy()
+    in_order = (eid[1:] > eid[:-1]) | ((eid[1:] == eid[:-1]) & (cyc[1:] > cyc[:-1]))
+    if not in_order.all():
+        df = df.sort_values(["engine_id", "cycle"], kind="mergesort", ignore_index=True)
+    return _categorize_engine_id(df)
+
+
+def _categorize_engine_id(df: pd.DataFrame) -> pd.DataFrame:
+    # engine_id is the grouping key everywhere downstream; as a categorical, groupby/isin
+    # work on the small integer codes instead of re-hashing the raw ids each time
+    df["engine_id"] = df["engine_id"].astype("category")
+    return df
+
+
+def _read_rul(src) -> pd.DataFrame:
+    # One short integer column: np.loadtxt beats spinning up a CSV reader for it
+    return pd.DataFrame({"RUL": np.loadtxt(src, dtype=np.int16, ndmin=1)})
+
+
+# --------------------------- Helper: Feather Cache --------------------------
+# Parsed frames are cached as uncompressed Feather (Arrow IPC): already-typed columnar
+# buffers that are memory-mapped back in, so a warm ingest skips text parsing entirely.
+# Caches always hold every column, so any `columns` selection can be served from them.
+_CACHE_PARTS = ("train", "test", "rul")
+_CACHE_VERSION = 3  # bump whenever parsing/dtypes change so stale caches are not reused
+
+
+def _cache_files(cache_dir: Path, subset: str, sources: list[Path]) -> dict[str, Path]:
+    # Keyed on the sources' (mtime, size): editing or replacing any of them invalidates the cache
+    # without having to read (hash) their contents.
+    stats = [(fp.stat().st_mtime_ns, fp.stat().st_size) for fp in sources]
+    key = hashlib.sha1(repr((_CACHE_VERSION, stats)).encode()).hexdigest()[:16]
+    return {part: cache_dir / f"{subset}_{key}_{part}.feather" for part in _CACHE_PARTS}
+
+
+def _read_cache(cache_fps: dict[str, Path], usecols: list[str] | None):
+    if not all(fp.exists() for fp in cache_fps.values()):
+        return None
+    frames = {
+        part: feather.read_table(fp, columns=usecols if part != "rul" else None, memory_map=True).to_pandas()
+        for part, fp in cache_fps.items()
+    }
+    # an integer categorical does not reliably round-trip through Arrow
+    return _categorize_engine_id(frames["train"]), _categorize_engine_id(frames["test"]), frames["rul"]
+
+
+def _write_cache(cache_fps: dict[str, Path], train_df: pd.DataFrame, test_df: pd.DataFrame,
+                 rul_truth: pd.DataFrame) -> None:
+    # Best-effort: the frames are already parsed, so a cache that cannot be written
+    # (read-only data dir, a file in the way, ...) only costs the next run a re-parse.
+    frames = {"train": train_df, "test": test_df, "rul": rul_truth}
+    for part, fp in cache_fps.items():
+        # write to a private temp file and rename, so concurrent runs never see a half-written cache
+        tmp = fp.with_name(f"{fp.name}.{os.getpid()}.tmp")
+        try:
+            fp.parent.mkdir(parents=True, exist_ok=True)
+            feather.write_feather(frames[part], tmp, compression="uncompressed")
+            os.replace(tmp, fp)
+        except OSError as e:
+            with contextlib.suppress(OSError):
+                tmp.unlink(missing_ok=True)
+            warnings.warn(f"Could not write the ingest cache ({fp}): {e}", stacklevel=2)
+            return
+    _prune_stale_cache(cache_fps)
+
+
+def _prune_stale_cache(cache_fps: dict[str, Path]) -> None:
+    # A new key means the sources changed, so the subset's older cache sets can never be hit again
+    keep = set(cache_fps.values())
+    for part, fp in cache_fps.items():
+        subset = fp.name.split("_", 1)[0]
+        for old in fp.parent.glob(f"{subset}_*_{part}.feather"):
+            if old not in keep:
+                with contextlib.suppress(OSError):
+                    old.unlink()
 
 
 # --------------------------- Typed Return Container -------------------------
@@ -42,8 +182,13 @@ class CmapssDataset:
 # ------------------------------ Abstract Base ------------------------------
 class DataIngestor(ABC):
     @abstractmethod
-    def ingest(self, input_path: str | Path, subset: str, verbose: bool = False) -> CmapssDataset:
-        """Ingest data from a zip or directory and return a CmapssDataset."""
+    def ingest(self, input_path: str | Path, subset: str, verbose: bool = False,
+               columns: list[str] | None = None, use_cache: bool = True) -> CmapssDataset:
+        """
+        Ingest data from a zip or directory and return a CmapssDataset.
+        `columns` restricts train/test to those C-MAPSS columns (engine_id/cycle always kept).
+        `use_cache` reuses/writes Feather copies of the parsed frames in cache_<subset>/.
+        """
         raise NotImplementedError
 
 
@@ -51,62 +196,73 @@ class DataIngestor(ABC):
 class CmapssZipDataIngestor(DataIngestor):
     """
     Reads a .zip that may contain files inside a subfolder (e.g., CMaps/train_FD001.txt).
-    We match members by their filename (endswith), not by exact path.
+    Members are matched by their bare filename (basename lookup), not by exact path;
+    if several share a name, the first one in the archive wins.
     """
 
     def _find_members(self, zf: zipfile.ZipFile, subset: str) -> List[str]:
         subset = subset.upper()
         wanted = [f"train_{subset}.txt", f"test_{subset}.txt", f"RUL_{subset}.txt"]
         names = zf.namelist()
-        found = []
-        for w in wanted:
-            matches = [n for n in names if n.endswith("/" + w) or n.endswith("\\" + w) or n.endswith(w)]
-            if not matches:
-                raise FileNotFoundError(
-                    f"Could not find {w} inside the zip. "
-                    f"Zip contains: {names[:8]}{'...' if len(names)>8 else ''}"
-                )
-            # take the first match (usually CMaps/<file>)
-            found.append(matches[0])
-        return found
-
-    def ingest(self, input_path: str | Path, subset: str, verbose: bool = False) -> CmapssDataset:
+        # one pass: index members by their bare filename (first occurrence wins, usually CMaps/<file>)
+        by_basename: dict[str, str] = {}
+        for n in names:
+            by_basename.setdefault(n.replace("\\", "/").rsplit("/", 1)[-1], n)
+        missing = [w for w in wanted if w not in by_basename]
+        if missing:
+            raise FileNotFoundError(
+                f"Could not find {missing} inside the zip. "
+                f"Zip contains: {names[:8]}{'...' if len(names)>8 else ''}"
+            )
+        return [by_basename[w] for w in wanted]
+
+    def ingest(self, input_path: str | Path, subset: str, verbose: bool = False,
+               columns: list[str] | None = None, use_cache: bool = True) -> CmapssDataset:
         # --- Robust to str or Path ---
         input_path = Path(input_path)
         subset = subset.upper()
+        usecols = _resolve_usecols(columns)
 
         if verbose:
             print(f"🔎 ZIP ingestion from: {input_path}")
 
-        extract_dir = input_path.parent / f"extracted_{subset}"
-        extract_dir.mkdir(parents=True, exist_ok=True)
+        if use_cache:
+            cache_fps = _cache_files(input_path.parent / f"cache_{subset}", subset, [input_path])
+            cached = _read_cache(cache_fps, usecols)
+            if cached is not None:
+                if verbose:
+                    print(f"⚡ Cache hit: {cache_fps['train'].parent}")
+                return CmapssDataset(subset, *cached)
 
+        # Parse members straight out of the archive: no extract-to-disk and read-back round trip
         with zipfile.ZipFile(input_path, "r") as zf:
-            members = self._find_members(zf, subset)
+            train_name, test_name, rul_name = self._find_members(zf, subset)
             if verbose:
-                print("📦 Members to extract:", members)
-            for m in members:
-                zf.extract(m, path=extract_dir)
-
-        # After extraction, files are under extract_dir/<maybe-subfolder>/filename.txt
-        # Find them by filename regardless of subfolder depth.
-        train_fp = next(extract_dir.rglob(f"train_{subset}.txt"))
-        test_fp = next(extract_dir.rglob(f"test_{subset}.txt"))
-        rul_fp = next(extract_dir.rglob(f"RUL_{subset}.txt"))
-
-        if verbose:
-            print(f"✅ Extracted to: {train_fp.parent}")
-
-        # Delegate reading to the directory ingestor
-        return CmapssDirectoryDataIngestor().ingest(train_fp.parent, subset=subset, verbose=verbose)
+                print("📦 Members to read:", [train_name, test_name, rul_name])
+            # a cache must hold every column, so only narrow the parse when not caching
+            parse_cols = None if use_cache else usecols
+            with zf.open(train_name) as fh:
+                train_df = _read_telemetry(fh, parse_cols)
+            with zf.open(test_name) as fh:
+                test_df = _read_telemetry(fh, parse_cols)
+            with zf.open(rul_name) as fh:
+                rul_truth = _read_rul(fh)
+
+        if use_cache:
+            _write_cache(cache_fps, train_df, test_df, rul_truth)
+            if usecols is not None:
+                train_df, test_df = train_df[usecols], test_df[usecols]
+        return CmapssDataset(subset=subset, train=train_df, test=test_df, rul_truth=rul_truth)
 
 
 # --------------------------- Concrete: Directory ---------------------------
 class CmapssDirectoryDataIngestor(DataIngestor):
-    def ingest(self, input_path: str | Path, subset: str, verbose: bool = False) -> CmapssDataset:
+    def ingest(self, input_path: str | Path, subset: str, verbose: bool = False,
+               columns: list[str] | None = None, use_cache: bool = True) -> CmapssDataset:
         # --- Robust to str or Path ---
         input_path = Path(input_path)
         subset = subset.upper()
+        usecols = _resolve_usecols(columns)
 
         if verbose:
             print(f"📂 Directory ingestion from: {input_path}")
@@ -128,10 +284,24 @@ class CmapssDirectoryDataIngestor(DataIngestor):
                 f"Tip: ensure your subset is correct (FD001..FD004)."
             )
 
-        cols = cmapss_columns()
-        train_df = pd.read_csv(train_fp, sep=r"\s+", header=None, names=cols)
-        test_df = pd.read_csv(test_fp, sep=r"\s+", header=None, names=cols)
-        rul_truth = pd.read_csv(rul_fp, sep=r"\s+", header=None, names=["RUL"])
+        if use_cache:
+            cache_fps = _cache_files(train_fp.parent / f"cache_{subset}", subset, [train_fp, test_fp, rul_fp])
+            cached = _read_cache(cache_fps, usecols)
+            if cached is not None:
+                if verbose:
+                    print(f"⚡ Cache hit: {cache_fps['train'].parent}")
+                return CmapssDataset(subset, *cached)
+
+        # A cache must hold every column, so only narrow the parse when not caching.
+        parse_cols = None if use_cache else usecols
+        train_df = _read_telemetry(train_fp, parse_cols)
+        test_df = _read_telemetry(test_fp, parse_cols)
+        rul_truth = _read_rul(rul_fp)
+
+        if use_cache:
+            _write_cache(cache_fps, train_df, test_df, rul_truth)
+            if usecols is not None:
+                train_df, test_df = train_df[usecols], test_df[usecols]
 
         if verbose:
             print("✅ Loaded:")
@@ -161,6 +331,7 @@ def parse_args() -> argparse.Namespace:
     ap.add_argument("--subset", default="FD001", choices=["FD001", "FD002", "FD003", "FD004"],
                     help="Subset to load (default: FD001)")
     ap.add_argument("--verbose", action="store_true", help="Print progress")
+    ap.add_argument("--no-cache", action="store_true", help="Always re-parse the text files")
     return ap.parse_args()
 
 
@@ -170,7 +341,7 @@ def main() -> None:
     subset = args.subset.upper()
 
     ingestor = DataIngestorFactory.get_data_ingestor(input_path)
-    dataset = ingestor.ingest(input_path, subset=subset, verbose=args.verbose)
+    dataset = ingestor.ingest(input_path, subset=subset, verbose=args.verbose, use_cache=not args.no_cache)
 
     print("\n📊 Summary:", dataset.summary())
 
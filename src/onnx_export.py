@@ -0,0 +1,35 @@
+# src/onnx_export.py
+import logging
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+from sklearn.pipeline import Pipeline
+
+try:
+    from skl2onnx import to_onnx
+except ImportError:  # skl2onnx is optional; models are then only logged as sklearn
+    to_onnx = None
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+def export_onnx(pipe: Pipeline, X_sample: pd.DataFrame, target_opset: int = 18) -> Optional[Any]:
+    """
+    Convert a fitted pipeline to an ONNX model taking one float32 [n_rows, n_features]
+    input, so it can be served with onnxruntime instead of sklearn's Python tree walk.
+    Returns None when skl2onnx is missing or the pipeline has no ONNX converter (e.g. XGBoost).
+    """
+    if to_onnx is None:
+        logging.info("skl2onnx not installed; skipping ONNX export.")
+        return None
+    # "passthrough" placeholders are no-ops that skl2onnx cannot convert, so drop them
+    steps = [(name, est) for name, est in pipe.steps if est not in (None, "passthrough")]
+    model = steps[0][1] if len(steps) == 1 else Pipeline(steps)
+    try:
+        return to_onnx(model, X_sample[:1].to_numpy(dtype=np.float32), target_opset=target_opset)
+    except Exception as e:
+        # converter errors can embed the whole tree ensemble; only log the first line
+        reason = str(e).splitlines()[0][:200] if str(e) else type(e).__name__
+        logging.warning(f"ONNX export failed, serving stays sklearn-only: {reason}")
+        return None
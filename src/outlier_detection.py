@@ -6,9 +6,46 @@ import numpy as np
 import pandas as pd
 import seaborn as sns
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; the pandas path below is used instead
+    njit = None
+
 # Setup logging configuration
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _zscore_outlier_mask(X: np.ndarray, threshold: float) -> np.ndarray:
+        """
+        Fused per-column Z-score: one Welford pass for mean/std (ddof=1, NaNs skipped,
+        same as pandas) and one pass to flag |z| > threshold. Columns run in parallel.
+        """
+        n_rows, n_cols = X.shape
+        out = np.zeros((n_rows, n_cols), dtype=np.bool_)
+        for j in prange(n_cols):
+            count = 0
+            mean = 0.0
+            m2 = 0.0
+            for i in range(n_rows):
+                x = X[i, j]
+                if not np.isnan(x):
+                    count += 1
+                    delta = x - mean
+                    mean += delta / count
+                    m2 += delta * (x - mean)
+            if count < 2:
+                continue
+            std = np.sqrt(m2 / (count - 1))
+            if std == 0.0:
+                continue
+            for i in range(n_rows):
+                # NaN compares False, so missing values are never flagged
+                if np.abs(X[i, j] - mean) / std > threshold:
+                    out[i, j] = True
+        return out
+
 # Abstract Base Class for Outlier Detection Strategy
 class OutlierDetectionStrategy(ABC):
     @abstractmethod
@@ -32,8 +69,13 @@ class ZScoreOutlierDetection(OutlierDetectionStrategy):
 
     def detect_outliers(self, df: pd.DataFrame) -> pd.DataFrame:
         logging.info("Detecting outliers using the Z-score method.")
-        z_scores = np.abs((df - df.mean()) / df.std())
-        outliers = z_scores > self.threshold
+        if njit is not None and all(isinstance(dt, np.dtype) and np.issubdtype(dt, np.number) for dt in df.dtypes):
+            X = df.to_numpy(dtype=np.float64)
+            mask = _zscore_outlier_mask(X, float(self.threshold))
+            outliers = pd.DataFrame(mask, index=df.index, columns=df.columns)
+        else:
+            z_scores = np.abs((df - df.mean()) / df.std())
+            outliers = z_scores > self.threshold
         logging.info(f"Outliers detected with Z-score threshold: {self.threshold}.")
         return outliers
 
@@ -1,6 +1,7 @@
 # steps/data_ingestion_step.py
 
 from pathlib import Path
+from typing import Optional
 import pandas as pd
 from zenml import step
 from src.ingest_data import DataIngestorFactory
@@ -10,6 +11,7 @@ def data_ingestion_step(
     file_path: str,
     subset: str = "FD001",    # required for C-MAPSS
     part: str = "train",      # "train" | "test" | "rul"
+    columns: Optional[list[str]] = None,  # parse only these (+ engine_id/cycle); None = all
 ) -> pd.DataFrame:
     """
     Ingest C-MAPSS data and return ONE DataFrame (train/test/rul) to match
@@ -19,7 +21,7 @@ def data_ingestion_step(
     ingestor = DataIngestorFactory.get_data_ingestor(file_path)
 
     # IMPORTANT: pass a Path to ingest() so .parent works
-    ds = ingestor.ingest(Path(file_path), subset=subset, verbose=True)
+    ds = ingestor.ingest(Path(file_path), subset=subset, verbose=True, columns=columns)
 
     part = part.lower()
     if part == "train":
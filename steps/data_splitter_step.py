@@ -17,7 +17,8 @@ def data_splitter_step(
     """
     if selected_features:
         cols = [c for c in selected_features if c in df.columns] + [target_column]
-        df = df.loc[:, cols]
+        # cols were filtered against df.columns above, so plain [] selection is safe
+        df = df[cols]
 
     splitter = DataSplitter(strategy=SimpleTrainTestSplitStrategy())
     X_train, X_test, y_train, y_test = splitter.split(df, target_column)
@@ -10,6 +10,7 @@ from src.feature_engineering import (
     LogTransformation,
     MinMaxScaling,
     OneHotEncoding,
+    QuantileBinning,
     StandardScaling,
 )
 
@@ -35,6 +36,8 @@ def feature_engineering_step(
         engineer = FeatureEngineer(MinMaxScaling(feat_list))
     elif strategy == "onehot_encoding":
         engineer = FeatureEngineer(OneHotEncoding(feat_list))
+    elif strategy == "quantile_bin":
+        engineer = FeatureEngineer(QuantileBinning(feat_list))
     else:
         raise ValueError(f"Unsupported feature engineering strategy: {strategy}")
 
@@ -45,4 +48,4 @@ def feature_engineering_step(
     if "RUL" in transformed.columns:
         keep.append("RUL")
 
-    return transformed.loc[:, keep]
+    return transformed[keep]
@@ -1,6 +1,7 @@
 # steps/model_building_step.py
 import logging
-from typing import Annotated, Literal
+import os
+from typing import Annotated, Literal, Optional
 
 import mlflow
 import pandas as pd
@@ -8,14 +9,20 @@ from sklearn.pipeline import Pipeline
 from zenml import ArtifactConfig, Model, step
 from zenml.client import Client
 
-from src.model_building import ModelBuilder, HistGBRStrategy, LinearRegressionStrategy
+from src.model_building import ModelBuilder, HistGBRStrategy, LinearRegressionStrategy, XGBGpuStrategy
+from src.onnx_export import export_onnx
 
-# Try to pick up an experiment tracker if one exists
-try:
-    _exp_tracker = Client().active_stack.experiment_tracker
-    _exp_name = _exp_tracker.name if _exp_tracker else None
-except Exception:
-    _exp_name = None
+# Patch sklearn for MLflow autologging once per process instead of on every step run
+mlflow.sklearn.autolog(log_models=True, silent=True, disable_for_unsupported_versions=True)
+
+
+def _experiment_tracker_name() -> Optional[str]:
+    # Try to pick up an experiment tracker if one exists (probed once, when the step is defined)
+    try:
+        exp_tracker = Client().active_stack.experiment_tracker
+        return exp_tracker.name if exp_tracker else None
+    except Exception:
+        return None
 
 model_meta = Model(
     name="engine_rul_predictor",
@@ -24,11 +31,11 @@ model_meta = Model(
     description="RUL prediction model for turbofan engines (C-MAPSS).",
 )
 
-@step(enable_cache=False, experiment_tracker=_exp_name, model=model_meta)
+@step(enable_cache=False, experiment_tracker=_experiment_tracker_name(), model=model_meta)
 def model_building_step(
     X_train: pd.DataFrame,
     y_train: pd.Series,
-    algorithm: Literal["hgb", "linreg"] = "hgb",
+    algorithm: Literal["hgb", "linreg", "xgb_gpu"] = "hgb",
 ) -> Annotated[Pipeline, ArtifactConfig(name="sklearn_pipeline", is_model_artifact=True)]:
     """
     Train a model pipeline for RUL.
@@ -36,31 +43,39 @@ def model_building_step(
     algorithm:
       - 'hgb'     -> HistGradientBoostingRegressor (recommended)
       - 'linreg'  -> LinearRegression (baseline)
+      - 'xgb_gpu' -> XGBoost hist trees on a CUDA GPU (needs xgboost + a GPU)
     """
-    if not isinstance(X_train, pd.DataFrame):
-        raise TypeError("X_train must be a pandas DataFrame.")
-    if not isinstance(y_train, pd.Series):
-        raise TypeError("y_train must be a pandas Series.")
-
     # Build with selected strategy
     if algorithm == "hgb":
         strategy = HistGBRStrategy()
+    elif algorithm == "xgb_gpu":
+        strategy = XGBGpuStrategy()
     else:
         strategy = LinearRegressionStrategy()
 
     builder = ModelBuilder(strategy=strategy)
 
-    # Start an MLflow run if possible; no-op if no tracker is set
-    if not mlflow.active_run():
+    # Start an MLflow run only if none is active (e.g. the tracker already opened one)
+    started_run = mlflow.active_run() is None
+    if started_run:
         mlflow.start_run()
 
     try:
-        mlflow.sklearn.autolog(log_models=True)
         logging.info(f"Training model with algorithm='{algorithm}'.")
         pipe = builder.build_model(X_train, y_train)
+
+        # Also log an ONNX copy (when skl2onnx is installed) that MLflow serves via onnxruntime
+        onnx_model = export_onnx(pipe, X_train)
+        if onnx_model is not None:
+            mlflow.onnx.log_model(
+                onnx_model,
+                "onnx_model",
+                onnx_execution_providers=["CPUExecutionProvider"],
+                onnx_session_options={"intra_op_num_threads": os.cpu_count() or 1},
+            )
     finally:
         # End run if one was started here
-        if mlflow.active_run():
+        if started_run:
             mlflow.end_run()
 
     return pipe
@@ -15,11 +15,6 @@ def model_evaluator_step(
     """
     Evaluate the trained pipeline on test data and return metrics + RMSE (for convenience).
     """
-    if not isinstance(X_test, pd.DataFrame):
-        raise TypeError("X_test must be a pandas DataFrame.")
-    if not isinstance(y_test, pd.Series):
-        raise TypeError("y_test must be a pandas Series.")
-
     # Because 'trained_model' is a Pipeline(preprocessor -> model), just call predict:
     evaluator = ModelEvaluator(strategy=RegressionModelEvaluationStrategy())
     metrics = evaluator.evaluate(trained_model, X_test, y_test)
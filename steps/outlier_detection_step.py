@@ -22,7 +22,9 @@ def outlier_detection_step(df: pd.DataFrame, column_name: str) -> pd.DataFrame:
         logging.error(f"Column '{column_name}' does not exist in the DataFrame.")
         raise ValueError(f"Column '{column_name}' does not exist in the DataFrame.")
         # Ensure only numeric columns are passed
-    df_numeric = df.select_dtypes(include=[int, float])
+    # "number" covers every numeric width; `int` only expands to int32/int64, which would
+    # silently drop the compact int16 'cycle'/'RUL' columns (and uint8 bin codes)
+    df_numeric = df.select_dtypes(include="number")
 
     outlier_detector = OutlierDetector(ZScoreOutlierDetection(threshold=3))
     outliers = outlier_detector.detect_outliers(df_numeric)
@@ -1,23 +1,36 @@
 from zenml import step
 import time, json, requests
+from requests.adapters import HTTPAdapter
+
+# One pooled session per process: /ping polls and /invocations reuse keep-alive connections.
+# No adapter retries: the /ping loop below owns waiting (a retried 1 s probe would stall
+# the backoff), and /invocations is a POST that should fail loudly rather than be replayed.
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
 
 @step(enable_cache=False)
 def predictor_http(service_url: str, input_json: str, wait_seconds: int = 60):
     base = service_url.rstrip("/")
-    # Wait for /ping instead of ZenML daemon state (WSL-friendly)
+    # Wait for /ping instead of ZenML daemon state (WSL-friendly).
+    # Exponential backoff (20 ms doubling up to 500 ms): an already-warm server answers
+    # on the first poll or two instead of after a fixed 1 s sleep.
+    delay = 0.02
     deadline = time.time() + wait_seconds
     while time.time() < deadline:
         try:
-            if requests.head(f"{base}/ping", timeout=2).status_code == 200:
+            if _session.head(f"{base}/ping", timeout=1).status_code == 200:
                 break
         except Exception:
             pass
-        time.sleep(1)
+        time.sleep(min(delay, max(deadline - time.time(), 0)))
+        delay = min(delay * 2, 0.5)
     else:
         raise RuntimeError(f"Server not reachable at {base}/ping")
 
     payload = json.loads(input_json)
-    r = requests.post(f"{base}/invocations",
+    r = _session.post(f"{base}/invocations",
                       headers={"Content-Type": "application/json"},
                       json=payload, timeout=30)
     r.raise_for_status()
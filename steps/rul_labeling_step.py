@@ -1,8 +1,41 @@
 # steps/rul_labeling_step.py
 
+import numpy as np
 import pandas as pd
 from zenml import step
 
+
+def _engines_contiguous(eid: np.ndarray) -> bool:
+    """True when each engine's rows form a single run (the usual C-MAPSS file order)."""
+    if len(eid) < 2 or np.all(eid[1:] >= eid[:-1]):  # sorted ids: one cheap comparison pass, no hashing
+        return True
+    return np.count_nonzero(eid[1:] != eid[:-1]) + 1 == len(pd.unique(eid))
+
+
+def _max_cycle_per_row(eid: np.ndarray, cyc: np.ndarray) -> np.ndarray:
+    """
+    Max cycle of each row's engine, via one segment reduction (no hashing).
+    Needs each engine's rows to be one contiguous run; otherwise a stable argsort
+    groups them first and the result is scattered back to the original row order.
+    """
+    n = len(eid)
+    if n == 0:
+        return cyc.copy()
+    order = None
+    if not _engines_contiguous(eid):  # some engine is split into several runs
+        order = np.argsort(eid, kind="stable")
+        eid, cyc = eid[order], cyc[order]
+    change = eid[1:] != eid[:-1]
+    starts = np.flatnonzero(np.r_[True, change])
+    seg_max = np.maximum.reduceat(cyc, starts)
+    max_cycle = np.repeat(seg_max, np.diff(np.r_[starts, n]))
+    if order is not None:
+        out = np.empty_like(max_cycle)
+        out[order] = max_cycle
+        max_cycle = out
+    return max_cycle
+
+
 @step
 def rul_labeling_step(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -11,7 +44,7 @@ def rul_labeling_step(df: pd.DataFrame) -> pd.DataFrame:
     RUL = (max cycle for engine_id) - (current cycle)
 
     Assumes columns:
-        - 'engine_id' : int
+        - 'engine_id' : int or categorical
         - 'cycle'     : int
     """
     if not isinstance(df, pd.DataFrame):
@@ -22,9 +55,12 @@ def rul_labeling_step(df: pd.DataFrame) -> pd.DataFrame:
     if missing:
         raise ValueError(f"Missing required columns for RUL labeling: {sorted(missing)}")
 
-    # compute RUL per engine without leakage
-    max_cycle = df.groupby("engine_id")["cycle"].transform("max")
-    df = df.copy()
-    df["RUL"] = (max_cycle - df["cycle"]).astype("int32")
+    # compute RUL per engine without leakage; the per-row max cycle is not returned,
+    # since max_cycle = RUL + cycle would hand the target to any model that sees it.
+    # The step input is a freshly loaded artifact, so RUL is added in place: without
+    # Copy-on-Write (pandas < 3), df.assign would deep-copy the whole telemetry frame.
+    eid = df["engine_id"].to_numpy()
+    cyc = df["cycle"].to_numpy()
+    df["RUL"] = (_max_cycle_per_row(eid, cyc) - cyc).astype(np.int16)
 
     return df